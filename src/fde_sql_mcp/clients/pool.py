@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Tuple
+
+PoolKey = Tuple[str, str]
+
+# Idle connections older than this are re-checked with a cheap round trip
+# before being handed out again.
+_VALIDATE_AFTER_SECONDS = 30.0
+_MAX_IDLE_PER_KEY = 4
+_MAX_CURSORS_PER_CONNECTION = 16
+
+
+def _close_quietly(resource: Any) -> None:
+    try:
+        resource.close()
+    except Exception:
+        pass
+
+
+@dataclass
+class PooledConnection:
+    """A live connection plus the time it was last returned to the pool."""
+
+    connection: Any
+    returned_at: float = field(default_factory=time.monotonic)
+    cursors: "OrderedDict[str, Tuple[str, Any]]" = field(
+        default_factory=OrderedDict
+    )
+
+    def statement_cursor(self, sql: str) -> Tuple[Any, str]:
+        """
+        Return the cursor reserved for *sql* and the SQL string to execute.
+
+        pyodbc skips the prepare round trip only when a cursor is handed the
+        very string object it prepared last time, not merely equal text, so
+        callers must execute the returned string rather than their own copy.
+        """
+        entry = self.cursors.pop(sql, None)
+        if entry is None:
+            entry = (sql, self.connection.cursor())
+            if len(self.cursors) >= _MAX_CURSORS_PER_CONNECTION:
+                _, (_, stale) = self.cursors.popitem(last=False)
+                _close_quietly(stale)
+        self.cursors[sql] = entry
+        canonical, cursor = entry
+        return cursor, canonical
+
+
+def _is_alive(connection: Any) -> bool:
+    try:
+        cursor = connection.execute("SELECT 1")
+        cursor.fetchone()
+        cursor.close()
+    except Exception:
+        return False
+    return True
+
+
+class ConnectionPool:
+    """
+    Keeps idle connections per (server, database) so tool calls can skip the
+    TCP/TLS/Windows-auth handshake. Connections idle longer than
+    ``max_idle_seconds`` are closed, for every key, by a background reaper
+    thread that starts the first time a connection is pooled.
+    """
+
+    def __init__(
+        self,
+        max_idle_seconds: float,
+        *,
+        validate_after_seconds: float = _VALIDATE_AFTER_SECONDS,
+        max_idle_per_key: int = _MAX_IDLE_PER_KEY,
+    ) -> None:
+        self.max_idle_seconds = max_idle_seconds
+        self.validate_after_seconds = validate_after_seconds
+        self.max_idle_per_key = max_idle_per_key
+        self._idle: Dict[PoolKey, Deque[PooledConnection]] = {}
+        self._lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_idle_seconds > 0 and self.max_idle_per_key > 0
+
+    def _pop_idle(self, key: PoolKey) -> PooledConnection | None:
+        with self._lock:
+            idle = self._idle.get(key)
+            if not idle:
+                return None
+            # Most recently returned first: it is the least likely to be stale.
+            return idle.pop()
+
+    def _take_expired(self, now: float) -> List[PooledConnection]:
+        # Caller holds the lock. Each deque is ordered oldest-first, so expired
+        # entries are always at the left end.
+        expired: List[PooledConnection] = []
+        for key in list(self._idle):
+            idle = self._idle[key]
+            while idle and now - idle[0].returned_at > self.max_idle_seconds:
+                expired.append(idle.popleft())
+            if not idle:
+                del self._idle[key]
+        return expired
+
+    def sweep(self) -> None:
+        """Close connections idle past ``max_idle_seconds``, for every key."""
+        with self._lock:
+            expired = self._take_expired(time.monotonic())
+        for pooled in expired:
+            _close_quietly(pooled.connection)
+
+    def _reap(self) -> None:
+        interval = max(self.max_idle_seconds / 2, 1.0)
+        while True:
+            time.sleep(interval)
+            self.sweep()
+
+    def _ensure_reaper(self) -> None:
+        # Caller holds the lock.
+        if self._reaper is None:
+            thread = threading.Thread(
+                target=self._reap, name="fde-sql-pool-reaper", daemon=True
+            )
+            thread.start()
+            self._reaper = thread
+
+    def acquire(
+        self, key: PoolKey, connect: Callable[[], Any]
+    ) -> PooledConnection:
+        """Check out an idle connection for *key*, opening one if needed."""
+        while (pooled := self._pop_idle(key)) is not None:
+            idle_for = time.monotonic() - pooled.returned_at
+            if idle_for > self.max_idle_seconds:
+                _close_quietly(pooled.connection)
+                continue
+            if idle_for > self.validate_after_seconds and not _is_alive(
+                pooled.connection
+            ):
+                _close_quietly(pooled.connection)
+                continue
+            return pooled
+        return PooledConnection(connection=connect())
+
+    def release(
+        self, key: PoolKey, pooled: PooledConnection, *, discard: bool = False
+    ) -> None:
+        """
+        Return *pooled* for reuse, or close it when *discard* is set.
+
+        The connection's transaction is rolled back first so nothing a call
+        did is committed or visible to the next borrower; if the rollback
+        fails the connection is closed instead.
+        """
+        if discard or not self.enabled:
+            _close_quietly(pooled.connection)
+            return
+        try:
+            pooled.connection.rollback()
+        except Exception:
+            _close_quietly(pooled.connection)
+            return
+        pooled.returned_at = time.monotonic()
+        with self._lock:
+            self._ensure_reaper()
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_idle_per_key:
+                idle.append(pooled)
+                return
+        _close_quietly(pooled.connection)
+
+    def clear(self) -> None:
+        """Close every idle connection held by the pool."""
+        with self._lock:
+            idle = [p for conns in self._idle.values() for p in conns]
+            self._idle.clear()
+        for pooled in idle:
+            _close_quietly(pooled.connection)
@@ -1,37 +1,105 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Optional
-
-import pyodbc
+import atexit
+import functools
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from ..config import settings
+from .pool import ConnectionPool, PooledConnection, PoolKey, _close_quietly
+
+if TYPE_CHECKING:
+    import pyodbc
+
+_POOL = ConnectionPool(settings.sql_pool_idle_timeout)
+atexit.register(_POOL.clear)
+
+
+@functools.cache
+def _pyodbc() -> ModuleType:
+    # Imported on first use so starting the server (or calling ping) does not
+    # load the ODBC driver manager.
+    import pyodbc
+
+    # The driver-manager pool is unreliable across ODBC drivers; connections
+    # are pooled in-process instead.
+    pyodbc.pooling = False
+    return pyodbc
+
+
+# Preferred order when the configured driver is not installed, lowercased to
+# match the keys of _installed_drivers().
+_FALLBACK_DRIVERS = tuple(
+    name.lower()
+    for name in (
+        "ODBC Driver 18 for SQL Server",
+        "ODBC Driver 17 for SQL Server",
+        "SQL Server",
+    )
+)
+
 
+@functools.lru_cache()
+def _installed_drivers() -> dict[str, str]:
+    return {d.lower(): d for d in _pyodbc().drivers()}
 
+
+@functools.lru_cache(maxsize=8)
 def _resolve_driver(preferred: Optional[str]) -> str:
-    installed = {d.lower(): d for d in pyodbc.drivers()}
+    installed = _installed_drivers()
     if preferred:
         key = preferred.strip("{}").lower()
         if key in installed:
             return "{" + installed[key] + "}"
 
-    fallback = [
-        "ODBC Driver 18 for SQL Server",
-        "ODBC Driver 17 for SQL Server",
-        "SQL Server",
-    ]
-    for name in fallback:
-        if name.lower() in installed:
-            return "{" + installed[name.lower()] + "}"
+    for key in _FALLBACK_DRIVERS:
+        if key in installed:
+            return "{" + installed[key] + "}"
 
     raise RuntimeError(
         "No SQL Server ODBC driver found. Install ODBC Driver 17 or 18."
     )
 
 
+_CONN_STR_TEMPLATE = (
+    "Driver={driver};"
+    "Server={server};"
+    "Database={database};"
+    "Trusted_Connection=yes;"
+    "Encrypt={encrypt};"
+    "TrustServerCertificate={trust_cert};"
+    "Connection Timeout={timeout};"
+    "Application Name=FDE SQL MCP;"
+    "{application_intent}"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_conn_str(server: str, database: str, driver: str) -> str:
+    # Cached so each tool call reuses the string for its (server, database)
+    # instead of reformatting it; the live connections themselves are in _POOL.
+    port = settings.sql_server_port
+    endpoint = f"{server},{port}" if port else server
+
+    intent = settings.sql_application_intent
+    return _CONN_STR_TEMPLATE.format(
+        driver=driver,
+        server=endpoint,
+        database=database,
+        encrypt="yes" if settings.sql_encrypt else "no",
+        trust_cert="yes" if settings.sql_trust_server_certificate else "no",
+        timeout=settings.sql_connection_timeout,
+        application_intent=f"ApplicationIntent={intent};" if intent else "",
+    )
+
+
 class SQLServerConnection:
     """
     Minimal SQL Server connector using Windows authentication.
+
+    Use as a context manager: entering checks a connection out of the pool
+    and exiting rolls it back and returns it (or discards it if the block
+    raised or the connection was marked not reusable).
     """
 
     def __init__(
@@ -43,44 +111,47 @@ class SQLServerConnection:
         self.server = server
         self.database = database
         self.driver = driver or _resolve_driver(settings.sql_driver)
-
-    def _build_conn_str(self) -> str:
-        server = self.server
-        if settings.sql_server_port:
-            server = f"{server},{settings.sql_server_port}"
-
-        parts = [
-            f"Driver={self.driver}",
-            f"Server={server}",
-            f"Database={self.database}",
-            "Trusted_Connection=yes",
-            f"Encrypt={'yes' if settings.sql_encrypt else 'no'}",
-            (
-                "TrustServerCertificate=yes"
-                if settings.sql_trust_server_certificate
-                else "TrustServerCertificate=no"
-            ),
-            f"Connection Timeout={settings.sql_connection_timeout}",
-            "Application Name=FDE SQL MCP",
-        ]
-        if settings.sql_application_intent:
-            parts.append(f"ApplicationIntent={settings.sql_application_intent}")
-        return ";".join(parts) + ";"
+        self._conn_str = _build_conn_str(server, database, self.driver)
+        self._pool_key: PoolKey = (server, database)
+        self._pooled: PooledConnection | None = None
+        # Set to False when the session may carry state a rollback cannot
+        # undo (USE, SET options, #temp tables); it is then closed on exit.
+        self.reusable = True
 
     def _conn_open(self) -> pyodbc.Connection:
-        conn_str = self._build_conn_str()
-        return pyodbc.connect(conn_str)
-
-    @contextmanager
-    def get_connection(self):
-        conn = self._conn_open()
+        # Autocommit stays off: the pool rolls back every connection before
+        # reuse, so nothing a tool call changes is ever committed.
+        connection = _pyodbc().connect(self._conn_str)
         try:
-            yield conn
-        finally:
-            try:
-                conn.close()
-            except Exception:
-                pass
+            # Session-wide, so batches on this connection need not repeat it.
+            connection.execute("SET NOCOUNT ON").close()
+        except Exception:
+            # Not pooled yet, so nothing else would ever close it.
+            _close_quietly(connection)
+            raise
+        return connection
+
+    def __enter__(self) -> pyodbc.Connection:
+        self._pooled = _POOL.acquire(self._pool_key, self._conn_open)
+        return self._pooled.connection
+
+    def statement_cursor(self, sql: str) -> Tuple[pyodbc.Cursor, str]:
+        """
+        Return the cursor on the checked-out connection reserved for *sql*,
+        plus the SQL string object to execute on it (see PooledConnection).
+        """
+        if self._pooled is None:
+            raise RuntimeError("SQLServerConnection is not open.")
+        return self._pooled.statement_cursor(sql)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pooled, self._pooled = self._pooled, None
+        if pooled is not None:
+            _POOL.release(
+                self._pool_key,
+                pooled,
+                discard=exc_type is not None or not self.reusable,
+            )
 
 
 def get_sql_connection(*, server: str, database: str) -> SQLServerConnection:
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from typing import Any, Callable, List, Tuple, TypeVar
+
+from ..config import settings
+
+T = TypeVar("T")
+
+_WorkItem = Tuple[
+    asyncio.AbstractEventLoop, "asyncio.Future[Any]", Callable[..., Any], tuple
+]
+
+
+def _resolve(
+    future: "asyncio.Future[Any]", result: Any, exc: Exception | None
+) -> None:
+    if future.cancelled():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+class DBWorker:
+    """
+    Runs blocking database calls on a fixed set of long-lived threads.
+
+    Tool calls share one queue, so no default-executor work item is created
+    per call; the threads start on the first submission. At most ``workers``
+    calls run at once: a slow ``run_readonly_query`` (up to
+    ``sql_query_timeout``) holds one thread, and with ``workers=1`` every
+    other database tool waits behind it.
+    """
+
+    def __init__(
+        self, name: str = "fde-sql-db-worker", workers: int = 1
+    ) -> None:
+        self.name = name
+        self.workers = max(workers, 1)
+        self._queue: "queue.SimpleQueue[_WorkItem]" = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        with self._lock:
+            if not self._threads:
+                threads = [
+                    threading.Thread(
+                        target=self._run,
+                        name=f"{self.name}-{index}",
+                        daemon=True,
+                    )
+                    for index in range(self.workers)
+                ]
+                for thread in threads:
+                    thread.start()
+                self._threads = threads
+
+    def _run(self) -> None:
+        while True:
+            loop, future, fn, args = self._queue.get()
+            result: Any = None
+            error: Exception | None = None
+            try:
+                result = fn(*args)
+            except Exception as exc:
+                error = exc
+            except BaseException as exc:
+                # e.g. SystemExit from a driver: resolve the caller instead of
+                # letting it end the only worker thread and hang later calls.
+                error = RuntimeError(f"Database call aborted: {exc!r}")
+                error.__cause__ = exc
+            try:
+                loop.call_soon_threadsafe(_resolve, future, result, error)
+            except RuntimeError:
+                # The submitting event loop has already closed.
+                pass
+
+    async def submit(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on a worker thread and await its result."""
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[T]" = loop.create_future()
+        self._queue.put((loop, future, fn, args))
+        return await future
+
+
+db_worker = DBWorker(workers=settings.sql_db_workers)
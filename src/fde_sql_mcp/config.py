@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 
 CONFIG_FILE_NAME = "fde_sql_mcp.config.json"
 _CONFIG_PATH = Path(__file__).resolve().parents[1] / CONFIG_FILE_NAME
 
+# Settings are resolved once at import, so read the environment once too.
+_ENV = dict(os.environ)
 
+
+@functools.cache
 def _load_local_settings() -> dict[str, object]:
     try:
         raw = _CONFIG_PATH.read_text()
@@ -40,14 +45,14 @@ def _local_setting(name: str) -> str | None:
 
 
 def _env_bool(name: str, default: bool) -> bool:
-    value = os.getenv(name)
+    value = _ENV.get(name)
     if value is None:
         return default
     return value.strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
 def _env_int(name: str, default: int) -> int:
-    value = os.getenv(name)
+    value = _ENV.get(name)
     if value is None:
         return default
     try:
@@ -59,7 +64,7 @@ def _env_int(name: str, default: int) -> int:
 def _get_sql_server() -> str:
     if server := _local_setting("sql_server"):
         return server
-    if env := os.getenv("SQL_SERVER_HOST"):
+    if env := _ENV.get("SQL_SERVER_HOST"):
         return env
     raise RuntimeError(
         "SQL_SERVER_HOST must be configured via an environment variable "
@@ -70,20 +75,20 @@ def _get_sql_server() -> str:
 def _get_sql_server_port() -> str | None:
     if port := _local_setting("sql_server_port"):
         return port
-    return os.getenv("SQL_SERVER_PORT")
+    return _ENV.get("SQL_SERVER_PORT")
 
 
 def _get_sql_database() -> str:
     return (
         _local_setting("sql_database")
-        or os.getenv("SQL_SERVER_DATABASE", "master")
+        or _ENV.get("SQL_SERVER_DATABASE", "master")
     )
 
 
 def _get_sql_driver() -> str:
     return (
         _local_setting("sql_driver")
-        or os.getenv("SQL_DRIVER", "{ODBC Driver 17 for SQL Server}")
+        or _ENV.get("SQL_DRIVER", "{ODBC Driver 17 for SQL Server}")
     )
 
 
@@ -103,7 +108,7 @@ def _normalize_application_intent(value: str | None) -> str | None:
 def _get_sql_application_intent() -> str | None:
     if intent := _local_setting("sql_application_intent"):
         return _normalize_application_intent(intent)
-    if env := os.getenv("SQL_APPLICATION_INTENT"):
+    if env := _ENV.get("SQL_APPLICATION_INTENT"):
         return _normalize_application_intent(env)
     return "ReadOnly"
 
@@ -127,50 +132,56 @@ def _get_int(local_name: str, env_name: str, default: int) -> int:
         return _env_int(env_name, default)
 
 
-@dataclass(frozen=True)
+_SQL_SERVER = _get_sql_server()
+_SQL_SERVER_PORT = _get_sql_server_port()
+_SQL_DATABASE = _get_sql_database()
+_SQL_DRIVER = _get_sql_driver()
+_SQL_APPLICATION_INTENT = _get_sql_application_intent()
+_SQL_ENCRYPT = _get_bool("sql_encrypt", "SQL_ENCRYPT", True)
+_SQL_TRUST_SERVER_CERTIFICATE = _get_bool(
+    "sql_trust_server_certificate", "SQL_TRUST_SERVER_CERTIFICATE", True
+)
+_SQL_CONNECTION_TIMEOUT = _get_int(
+    "sql_connection_timeout", "SQL_CONNECTION_TIMEOUT", 30
+)
+_SQL_QUERY_TIMEOUT = _get_int("sql_query_timeout", "SQL_QUERY_TIMEOUT", 30)
+_SQL_MAX_ROWS = _get_int("sql_max_rows", "SQL_MAX_ROWS", 200)
+_SQL_MAX_QUERY_CHARS = _get_int(
+    "sql_max_query_chars", "SQL_MAX_QUERY_CHARS", 10000
+)
+_SQL_ENFORCE_READONLY = _get_bool(
+    "sql_enforce_readonly", "SQL_ENFORCE_READONLY", True
+)
+_SQL_POOL_IDLE_TIMEOUT = _get_int(
+    "sql_pool_idle_timeout", "SQL_POOL_IDLE_TIMEOUT", 300
+)
+_SQL_METADATA_CACHE_TTL = _get_int(
+    "sql_metadata_cache_ttl", "SQL_METADATA_CACHE_TTL", 30
+)
+_SQL_DB_WORKERS = _get_int("sql_db_workers", "SQL_DB_WORKERS", 4)
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """
     Package-wide configuration loaded from the local config file and environment.
     """
 
-    sql_server: str = field(default_factory=_get_sql_server)
-    sql_server_port: str | None = field(default_factory=_get_sql_server_port)
-    sql_database: str = field(default_factory=_get_sql_database)
-    sql_driver: str = field(default_factory=_get_sql_driver)
-    sql_application_intent: str | None = field(
-        default_factory=_get_sql_application_intent
-    )
-    sql_encrypt: bool = field(
-        default_factory=lambda: _get_bool("sql_encrypt", "SQL_ENCRYPT", True)
-    )
-    sql_trust_server_certificate: bool = field(
-        default_factory=lambda: _get_bool(
-            "sql_trust_server_certificate", "SQL_TRUST_SERVER_CERTIFICATE", True
-        )
-    )
-    sql_connection_timeout: int = field(
-        default_factory=lambda: _get_int(
-            "sql_connection_timeout", "SQL_CONNECTION_TIMEOUT", 30
-        )
-    )
-    sql_query_timeout: int = field(
-        default_factory=lambda: _get_int(
-            "sql_query_timeout", "SQL_QUERY_TIMEOUT", 30
-        )
-    )
-    sql_max_rows: int = field(
-        default_factory=lambda: _get_int("sql_max_rows", "SQL_MAX_ROWS", 200)
-    )
-    sql_max_query_chars: int = field(
-        default_factory=lambda: _get_int(
-            "sql_max_query_chars", "SQL_MAX_QUERY_CHARS", 10000
-        )
-    )
-    sql_enforce_readonly: bool = field(
-        default_factory=lambda: _get_bool(
-            "sql_enforce_readonly", "SQL_ENFORCE_READONLY", True
-        )
-    )
+    sql_server: str = _SQL_SERVER
+    sql_server_port: str | None = _SQL_SERVER_PORT
+    sql_database: str = _SQL_DATABASE
+    sql_driver: str = _SQL_DRIVER
+    sql_application_intent: str | None = _SQL_APPLICATION_INTENT
+    sql_encrypt: bool = _SQL_ENCRYPT
+    sql_trust_server_certificate: bool = _SQL_TRUST_SERVER_CERTIFICATE
+    sql_connection_timeout: int = _SQL_CONNECTION_TIMEOUT
+    sql_query_timeout: int = _SQL_QUERY_TIMEOUT
+    sql_max_rows: int = _SQL_MAX_ROWS
+    sql_max_query_chars: int = _SQL_MAX_QUERY_CHARS
+    sql_enforce_readonly: bool = _SQL_ENFORCE_READONLY
+    sql_pool_idle_timeout: int = _SQL_POOL_IDLE_TIMEOUT
+    sql_metadata_cache_ttl: int = _SQL_METADATA_CACHE_TTL
+    sql_db_workers: int = _SQL_DB_WORKERS
 
 
 settings = Settings()
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-import asyncio
 import sys
 from typing import Any, Dict, List
 
 from mcp.server.fastmcp import FastMCP
 
+from .clients.worker import db_worker
 from .tools import databases as DB
 
 # -----------------------------------------------------------------------------
 # MCP Server Setup
 # -----------------------------------------------------------------------------
+# FastMCP encodes tool results with pydantic_core (a native encoder that handles
+# datetime/Decimal values from pyodbc), so no separate JSON library is needed.
+# json_response only selects plain JSON over SSE for the streamable-HTTP transport.
 mcp = FastMCP("FDE SQL MCP", json_response=True)
 
 
@@ -32,7 +35,7 @@ async def ping() -> str:
     )
 )
 async def list_databases() -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(DB.list_databases_impl)
+    return await db_worker.submit(DB.list_databases_impl)
 
 
 @mcp.tool(
@@ -42,39 +45,50 @@ async def list_databases() -> List[Dict[str, Any]]:
     )
 )
 async def list_tables(database: str) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(DB.list_tables_impl, database)
+    return await db_worker.submit(DB.list_tables_impl, database)
 
 
 @mcp.tool(
     description=("List views in the specified database along with schema and timestamps.")
 )
 async def list_views(database: str) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(DB.list_views_impl, database)
+    return await db_worker.submit(DB.list_views_impl, database)
 
 
 @mcp.tool(
     description=("List stored procedures in the specified database with metadata.")
 )
 async def list_stored_procedures(database: str) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(DB.list_stored_procedures_impl, database)
+    return await db_worker.submit(DB.list_stored_procedures_impl, database)
 
 
 @mcp.tool(
     description=("List indexes for tables in the specified database.")
 )
 async def list_indexes(database: str) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(DB.list_indexes_impl, database)
+    return await db_worker.submit(DB.list_indexes_impl, database)
 
 
 @mcp.tool(
     description=(
-        "Run a validated, read-only SELECT query with row limits enforced."
+        "Describe a database in one call: tables, views, stored procedures, "
+        "indexes, and the databases on the instance."
+    )
+)
+async def describe_database(database: str) -> Dict[str, List[Dict[str, Any]]]:
+    return await db_worker.submit(DB.describe_database_impl, database)
+
+
+@mcp.tool(
+    description=(
+        "Run a validated, read-only SELECT query with row limits enforced. "
+        "Returns column names once plus rows as value lists."
     )
 )
 async def run_readonly_query(
     database: str, query: str, max_rows: int | None = None
 ) -> Dict[str, Any]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.run_readonly_query_impl, database, query, max_rows
     )
 
@@ -87,7 +101,7 @@ async def run_readonly_query(
 async def list_table_columns(
     database: str, schema: str, table: str
 ) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.list_table_columns_impl, database, schema, table
     )
 
@@ -100,7 +114,7 @@ async def list_table_columns(
 async def list_view_columns(
     database: str, schema: str, view: str
 ) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.list_view_columns_impl, database, schema, view
     )
 
@@ -113,7 +127,7 @@ async def list_view_columns(
 async def list_table_constraints(
     database: str, schema: str, table: str
 ) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.list_table_constraints_impl, database, schema, table
     )
 
@@ -124,7 +138,7 @@ async def list_table_constraints(
 async def list_foreign_keys(
     database: str, schema: str, table: str
 ) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.list_foreign_keys_impl, database, schema, table
     )
 
@@ -137,18 +151,32 @@ async def list_foreign_keys(
 async def list_index_details(
     database: str, schema: str, table: str
 ) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.list_index_details_impl, database, schema, table
     )
 
 
+@mcp.tool(
+    description=(
+        "Describe a table in one call: columns, primary key/unique "
+        "constraints, foreign keys, and index details (schema required)."
+    )
+)
+async def describe_table(
+    database: str, schema: str, table: str
+) -> Dict[str, List[Dict[str, Any]]]:
+    return await db_worker.submit(
+        DB.describe_table_impl, database, schema, table
+    )
+
+
 @mcp.tool(
     description=("Return the SQL definition of a view.")
 )
 async def list_view_definition(
     database: str, schema: str, view: str
 ) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.list_view_definition_impl, database, schema, view
     )
 
@@ -159,7 +187,7 @@ async def list_view_definition(
 async def list_stored_procedure_definition(
     database: str, schema: str, procedure: str
 ) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.list_stored_procedure_definition_impl, database, schema, procedure
     )
 
@@ -170,7 +198,7 @@ async def list_stored_procedure_definition(
 async def list_stored_procedure_parameters(
     database: str, schema: str, procedure: str
 ) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.list_stored_procedure_parameters_impl, database, schema, procedure
     )
 
@@ -181,7 +209,7 @@ async def list_stored_procedure_parameters(
 async def list_object_dependencies(
     database: str, schema: str, object_name: str
 ) -> List[Dict[str, Any]]:
-    return await asyncio.to_thread(
+    return await db_worker.submit(
         DB.list_object_dependencies_impl, database, schema, object_name
     )
 
@@ -1,29 +1,153 @@
 from __future__ import annotations
 
+import functools
+import operator
 import re
-from typing import Any, Dict, List, Sequence
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+
+try:
+    import re2 as _strip_engine
+except ImportError:
+    _strip_engine = re
 
 from ..clients.sql import get_sql_connection
 from ..config import settings
 
+# Hot-path settings read on every query, bound once as module globals.
+_ENFORCE_READONLY = settings.sql_enforce_readonly
+_MAX_QUERY_CHARS = settings.sql_max_query_chars
+_MAX_ROWS = settings.sql_max_rows
+_QUERY_TIMEOUT = settings.sql_query_timeout
+
+
+# Rows pulled from the driver per round trip; bounds how many raw rows are
+# held alongside their dict copies.
+_FETCH_BATCH_SIZE = 1000
+
+
+# cursor.description entries are 7-tuples whose first item is the name.
+_column_name = operator.itemgetter(0)
+
+
+def _column_names(cursor: Any) -> Tuple[str, ...]:
+    """Return the interned column names of the cursor's current result set."""
+    return tuple(map(sys.intern, map(_column_name, cursor.description or ())))
+
+
+def _rows_to_dicts(
+    columns: Tuple[str, ...], rows: Sequence[Sequence[Any]]
+) -> List[Dict[str, Any]]:
+    """Convert driver rows to dicts keyed by *columns* without a Python loop."""
+    return list(map(dict, map(functools.partial(zip, columns), rows)))
+
+
+# Column names per catalog query text. Only the static _Q_* queries run
+# through _execute_rows, and their result shape never changes.
+_COLUMNS_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+
+def _read_rows(cursor: Any, query: str) -> List[Dict[str, Any]]:
+    """Drain the cursor's current result set, produced by *query*, as dicts."""
+    columns = _COLUMNS_CACHE.get(query)
+    if columns is None:
+        columns = _COLUMNS_CACHE[query] = _column_names(cursor)
+    results: List[Dict[str, Any]] = []
+    while batch := cursor.fetchmany():
+        results.extend(_rows_to_dicts(columns, batch))
+    return results
+
+
+def _execute_rows(
+    cursor: Any, query: str, params: Sequence[Any] | None = None
+) -> List[Dict[str, Any]]:
+    """Run *query* on an open cursor and return its rows as dicts."""
+    cursor.arraysize = _FETCH_BATCH_SIZE
+    cursor.execute(query, params or ())
+    return _read_rows(cursor, query)
+
+
+class _TTLCache:
+    """Thread-safe mapping whose entries expire *ttl* seconds after insertion."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.maxsize:
+                # dicts keep insertion order, so the first key is the oldest.
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_METADATA_CACHE = _TTLCache(maxsize=128, ttl=settings.sql_metadata_cache_ttl)
+
+
+def invalidate_metadata_cache() -> None:
+    """Drop every cached metadata result so the next call hits SQL Server."""
+    _METADATA_CACHE.clear()
+
+
+def _copy_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Row values are immutable scalars, so copying each dict is a deep copy.
+    return list(map(dict, rows))
+
 
 def _fetch_rows(
     database: str, query: str, params: Sequence[Any] | None = None
 ) -> List[Dict[str, Any]]:
-    """Run the provided query against *database* and return rows as dicts."""
-    conn = get_sql_connection(
+    """Run the provided query against *database* and return rows as dicts.
+
+    Results are cached for ``sql_metadata_cache_ttl`` seconds per
+    (server, database, query, params).
+    """
+    key = (settings.sql_server, database, query, tuple(params or ()))
+    cached = _METADATA_CACHE.get(key)
+    if cached is not None:
+        return _copy_rows(cached)
+
+    with get_sql_connection(
         server=settings.sql_server,
         database=database,
-    )
-    with conn.get_connection() as connection:
+    ) as connection:
         cursor = connection.cursor()
-        cursor.timeout = settings.sql_query_timeout
-        cursor.execute(query, params or ())
-        columns = [column[0] for column in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
-
-
-_DISALLOWED_KEYWORDS = {
+        try:
+            cursor.timeout = _QUERY_TIMEOUT
+            rows = _execute_rows(cursor, query, params)
+        finally:
+            # Close before the connection goes back to the pool, where another
+            # thread may check it out.
+            cursor.close()
+    _METADATA_CACHE.set(key, rows)
+    return _copy_rows(rows)
+
+
+_DISALLOWED_KEYWORDS = frozenset({
     "add",
     "alter",
     "backup",
@@ -54,361 +178,479 @@ _DISALLOWED_KEYWORDS = {
     "update",
     "use",
     "dbcc",
-}
+})
+
+
+# System/extended stored procedure name prefixes.
+_PROC_PREFIXES = frozenset(("xp_", "sp_"))
+
+
+# Block comments, line comments, string literals, and [quoted] identifiers,
+# matched left to right in one pass so e.g. "--" inside a string is not
+# mistaken for a comment. Flags are inline so the same pattern compiles under
+# google-re2 (linear-time, optional) or the stdlib engine.
+_STRIP_RE = _strip_engine.compile(
+    r"(?si)/\*.*?\*/|--[^\r\n]*|N?'(?:''|[^'])*'|\[[^\]]*\]"
+)
+_LEAD_RE = re.compile(r"^\s*(with|select)\b", re.I)
+_IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*", re.A)
 
 
 def _strip_sql_comments_and_literals(sql: str) -> str:
-    without_block_comments = re.sub(r"/\*.*?\*/", " ", sql, flags=re.S)
-    without_line_comments = re.sub(r"--[^\r\n]*", " ", without_block_comments)
-    without_strings = re.sub(
-        r"(?is)N?'(?:''|[^'])*'", " ", without_line_comments
-    )
-    without_brackets = re.sub(r"\[[^\]]*\]", " ", without_strings)
-    return without_brackets
+    return _STRIP_RE.sub(" ", sql)
 
 
 def _validate_readonly_query(query: str) -> None:
-    if not settings.sql_enforce_readonly:
+    if not _ENFORCE_READONLY:
         return
 
-    if not query or not query.strip():
+    if not query or query.isspace():
         raise ValueError("Query cannot be empty.")
 
-    if len(query) > settings.sql_max_query_chars:
+    if len(query) > _MAX_QUERY_CHARS:
         raise ValueError(
             "Query exceeds the maximum allowed length for read-only execution."
         )
 
+    error = _readonly_query_error(query)
+    if error is not None:
+        raise ValueError(error)
+
+
+@functools.lru_cache(maxsize=1024)
+def _readonly_query_error(query: str) -> str | None:
+    """
+    Return why *query* is not an allowed read-only statement, or None.
+
+    Cached by query text because agents often re-issue the same query; the
+    message is returned rather than raised since lru_cache does not cache
+    exceptions.
+    """
     stripped = _strip_sql_comments_and_literals(query)
-    if not re.match(r"^\s*(with|select)\b", stripped, flags=re.I):
-        raise ValueError(
+    if not _LEAD_RE.match(stripped):
+        return (
             "Only SELECT statements (optionally starting with WITH) "
             "are allowed in read-only mode."
         )
 
+    # A trailing semicolon is allowed; search everything before the last
+    # character without slicing a copy of the query.
     stripped_no_ws = stripped.strip()
-    if ";" in stripped_no_ws[:-1]:
-        raise ValueError("Multiple statements are not allowed in read-only mode.")
+    if stripped_no_ws.find(";", 0, len(stripped_no_ws) - 1) != -1:
+        return "Multiple statements are not allowed in read-only mode."
 
-    tokens = re.findall(r"[A-Za-z_][A-Za-z0-9_]*", stripped)
-    for token in tokens:
+    for match in _IDENT_RE.finditer(stripped):
+        token = match.group()
         lower = token.lower()
         if lower in _DISALLOWED_KEYWORDS:
-            raise ValueError(
-                f"Disallowed keyword detected in read-only mode: {token}"
-            )
-        if lower.startswith("xp_") or lower.startswith("sp_"):
-            raise ValueError(
-                "Executing procedures is not allowed in read-only mode."
-            )
+            return f"Disallowed keyword detected in read-only mode: {token}"
+        if lower[:3] in _PROC_PREFIXES:
+            return "Executing procedures is not allowed in read-only mode."
+    return None
 
 
 def _normalize_max_rows(max_rows: int | None) -> int:
     if max_rows is None:
-        return settings.sql_max_rows
+        return _MAX_ROWS
     try:
         value = int(max_rows)
     except (TypeError, ValueError):
-        return settings.sql_max_rows
+        return _MAX_ROWS
     if value <= 0:
-        return settings.sql_max_rows
-    return min(value, settings.sql_max_rows)
+        return _MAX_ROWS
+    return min(value, _MAX_ROWS)
 
 
 def run_readonly_query_impl(
     database: str, query: str, max_rows: int | None = None
 ) -> Dict[str, Any]:
-    """Execute a validated, read-only query with row limits enforced."""
+    """
+    Execute a validated, read-only query with row limits enforced.
+
+    Rows are returned column-oriented: ``columns`` holds the names once and
+    each entry of ``rows`` is a list of values in that order.
+    """
     _validate_readonly_query(query)
+    limit = _normalize_max_rows(max_rows)
+    # The row cap is a parameter so one prepared statement serves every limit.
+    # SET ROWCOUNT is used rather than wrapping the query in
+    # "SELECT TOP (?) * FROM (...) AS q": a derived table rejects CTEs,
+    # ORDER BY without TOP, and unnamed columns, all valid here.
+    statement = f"SET ROWCOUNT ?; {query}"
     conn = get_sql_connection(
         server=settings.sql_server,
         database=database,
     )
-    limit = _normalize_max_rows(max_rows)
-    with conn.get_connection() as connection:
-        cursor = connection.cursor()
-        cursor.timeout = settings.sql_query_timeout
-        cursor.execute(f"SET NOCOUNT ON; SET ROWCOUNT {limit}; {query}")
-        columns = [column[0] for column in cursor.description or []]
-        rows = cursor.fetchall()
+    # Without the read-only guard the query may change session state that a
+    # rollback does not undo, so that session is never handed to another call.
+    conn.reusable = _ENFORCE_READONLY
+    with conn as connection:
+        # Execute the cached string object so pyodbc reuses its prepared plan.
+        cursor, statement = conn.statement_cursor(statement)
+        cursor.timeout = _QUERY_TIMEOUT
+        # Ask for one row past the limit: seeing it is how truncation is
+        # detected, and the server still stops early. The server caps the
+        # batch there, so one fetchmany call can drain it.
+        fetch_limit = limit + 1
+        cursor.arraysize = fetch_limit
+        cursor.execute(statement, fetch_limit)
+        columns = _column_names(cursor)
+        # pyodbc.Row is not JSON-serializable by FastMCP, so each batch is
+        # converted to plain lists as it arrives and the Rows are freed at once.
+        rows: List[List[Any]] = []
+        while len(rows) < fetch_limit and (batch := cursor.fetchmany()):
+            rows.extend(map(list, batch))
+        # Finish the batch so the cached cursor holds no pending results.
+        while cursor.nextset():
+            pass
+        # Connections are pooled, so the row cap must not outlive this call.
+        connection.execute("SET ROWCOUNT 0").close()
+    truncated = len(rows) > limit
+    del rows[limit:]
     return {
-        "rows": [dict(zip(columns, row)) for row in rows],
+        "columns": list(columns),
+        "rows": rows,
         "row_count": len(rows),
         "row_limit": limit,
-        "truncated": len(rows) >= limit,
+        "truncated": truncated,
     }
 
 
+_Q_LIST_DATABASES = sys.intern(
+    "SELECT name, database_id, state_desc, recovery_model_desc "
+    "FROM sys.databases "
+    "ORDER BY name"
+)
+
+_Q_LIST_TABLES = sys.intern(
+    "SELECT s.name AS schema_name, t.name AS table_name, "
+    "t.create_date, t.modify_date, t.is_ms_shipped, t.temporal_type_desc "
+    "FROM sys.tables t "
+    "JOIN sys.schemas s ON t.schema_id = s.schema_id "
+    "ORDER BY s.name, t.name"
+)
+
+_Q_LIST_VIEWS = sys.intern(
+    "SELECT s.name AS schema_name, v.name AS view_name, "
+    "v.create_date, v.modify_date, v.is_ms_shipped "
+    "FROM sys.views v "
+    "JOIN sys.schemas s ON v.schema_id = s.schema_id "
+    "ORDER BY s.name, v.name"
+)
+
+_Q_LIST_STORED_PROCEDURES = sys.intern(
+    "SELECT s.name AS schema_name, p.name AS procedure_name, "
+    "p.create_date, p.modify_date, p.is_ms_shipped, p.type_desc "
+    "FROM sys.procedures p "
+    "JOIN sys.schemas s ON p.schema_id = s.schema_id "
+    "ORDER BY s.name, p.name"
+)
+
+_Q_LIST_INDEXES = sys.intern(
+    "SELECT s.name AS schema_name, t.name AS table_name, i.name AS index_name, "
+    "i.type_desc, i.is_unique, i.is_primary_key, i.is_disabled, i.fill_factor "
+    "FROM sys.indexes i "
+    "JOIN sys.tables t ON i.object_id = t.object_id "
+    "JOIN sys.schemas s ON t.schema_id = s.schema_id "
+    "WHERE i.name IS NOT NULL "
+    "ORDER BY s.name, t.name, i.name"
+)
+
+
 def list_databases_impl() -> List[Dict[str, Any]]:
     """List every database visible to the configured server user."""
-    return _fetch_rows(
-        settings.sql_database,
-        (
-            "SELECT name, database_id, state_desc, recovery_model_desc "
-            "FROM sys.databases "
-            "ORDER BY name"
-        ),
-    )
+    return _fetch_rows(settings.sql_database, _Q_LIST_DATABASES)
 
 
 def list_tables_impl(database: str) -> List[Dict[str, Any]]:
     """Return tables in *database*, one row per table with timestamps."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT s.name AS schema_name, t.name AS table_name, "
-            "t.create_date, t.modify_date, t.is_ms_shipped, t.temporal_type_desc "
-            "FROM sys.tables t "
-            "JOIN sys.schemas s ON t.schema_id = s.schema_id "
-            "ORDER BY s.name, t.name"
-        ),
-    )
+    return _fetch_rows(database, _Q_LIST_TABLES)
 
 
 def list_views_impl(database: str) -> List[Dict[str, Any]]:
     """Return views in *database* along with creation metadata."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT s.name AS schema_name, v.name AS view_name, "
-            "v.create_date, v.modify_date, v.is_ms_shipped "
-            "FROM sys.views v "
-            "JOIN sys.schemas s ON v.schema_id = s.schema_id "
-            "ORDER BY s.name, v.name"
-        ),
-    )
+    return _fetch_rows(database, _Q_LIST_VIEWS)
 
 
 def list_stored_procedures_impl(database: str) -> List[Dict[str, Any]]:
     """Return stored procedures in *database* with type descriptions."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT s.name AS schema_name, p.name AS procedure_name, "
-            "p.create_date, p.modify_date, p.is_ms_shipped, p.type_desc "
-            "FROM sys.procedures p "
-            "JOIN sys.schemas s ON p.schema_id = s.schema_id "
-            "ORDER BY s.name, p.name"
-        ),
-    )
+    return _fetch_rows(database, _Q_LIST_STORED_PROCEDURES)
 
 
 def list_indexes_impl(database: str) -> List[Dict[str, Any]]:
     """Return indexes scoped to tables in *database*."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT s.name AS schema_name, t.name AS table_name, i.name AS index_name, "
-            "i.type_desc, i.is_unique, i.is_primary_key, i.is_disabled, i.fill_factor "
-            "FROM sys.indexes i "
-            "JOIN sys.tables t ON i.object_id = t.object_id "
-            "JOIN sys.schemas s ON t.schema_id = s.schema_id "
-            "WHERE i.name IS NOT NULL "
-            "ORDER BY s.name, t.name, i.name"
-        ),
-    )
+    return _fetch_rows(database, _Q_LIST_INDEXES)
+
+
+_DESCRIBE_DATABASE_SECTIONS = (
+    ("tables", _Q_LIST_TABLES),
+    ("views", _Q_LIST_VIEWS),
+    ("procedures", _Q_LIST_STORED_PROCEDURES),
+    ("indexes", _Q_LIST_INDEXES),
+    ("databases", _Q_LIST_DATABASES),
+)
+
+# One batch, one result set per section, read back in order with nextset().
+_Q_DESCRIBE_DATABASE = sys.intern(
+    "; ".join(query for _, query in _DESCRIBE_DATABASE_SECTIONS)
+)
+
+
+def describe_database_impl(database: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the core catalog listings for *database* in one round trip.
+
+    The snapshot is cached like the individual listings in ``_fetch_rows``.
+    """
+    key = (settings.sql_server, database, _Q_DESCRIBE_DATABASE, ())
+    cached = _METADATA_CACHE.get(key)
+    if cached is not None:
+        return {section: _copy_rows(rows) for section, rows in cached.items()}
+
+    snapshot: Dict[str, List[Dict[str, Any]]] = {}
+    with get_sql_connection(
+        server=settings.sql_server,
+        database=database,
+    ) as connection:
+        cursor = connection.cursor()
+        try:
+            cursor.timeout = _QUERY_TIMEOUT
+            cursor.arraysize = _FETCH_BATCH_SIZE
+            cursor.execute(_Q_DESCRIBE_DATABASE)
+            for index, (section, query) in enumerate(
+                _DESCRIBE_DATABASE_SECTIONS
+            ):
+                if index:
+                    cursor.nextset()
+                snapshot[section] = _read_rows(cursor, query)
+        finally:
+            cursor.close()
+    _METADATA_CACHE.set(key, snapshot)
+    return {section: _copy_rows(rows) for section, rows in snapshot.items()}
+
+
+_Q_TABLE_COLUMNS = sys.intern(
+    "SELECT c.column_id, c.name AS column_name, t.name AS data_type, "
+    "c.max_length, c.precision, c.scale, c.is_nullable, "
+    "c.is_identity, c.is_computed, c.is_rowguidcol, "
+    "c.collation_name, dc.definition AS default_definition "
+    "FROM sys.columns c "
+    "JOIN sys.tables tbl ON c.object_id = tbl.object_id "
+    "JOIN sys.schemas s ON tbl.schema_id = s.schema_id "
+    "JOIN sys.types t ON c.user_type_id = t.user_type_id "
+    "LEFT JOIN sys.default_constraints dc "
+    "ON c.default_object_id = dc.object_id "
+    "WHERE s.name = ? AND tbl.name = ? "
+    "ORDER BY c.column_id"
+)
+
+_Q_VIEW_COLUMNS = sys.intern(
+    "SELECT c.column_id, c.name AS column_name, t.name AS data_type, "
+    "c.max_length, c.precision, c.scale, c.is_nullable, "
+    "c.collation_name "
+    "FROM sys.columns c "
+    "JOIN sys.views v ON c.object_id = v.object_id "
+    "JOIN sys.schemas s ON v.schema_id = s.schema_id "
+    "JOIN sys.types t ON c.user_type_id = t.user_type_id "
+    "WHERE s.name = ? AND v.name = ? "
+    "ORDER BY c.column_id"
+)
+
+_Q_TABLE_CONSTRAINTS = sys.intern(
+    "SELECT kc.name AS constraint_name, kc.type_desc, "
+    "col.name AS column_name, ic.key_ordinal "
+    "FROM sys.key_constraints kc "
+    "JOIN sys.tables t ON kc.parent_object_id = t.object_id "
+    "JOIN sys.schemas s ON t.schema_id = s.schema_id "
+    "JOIN sys.index_columns ic "
+    "ON kc.parent_object_id = ic.object_id "
+    "AND kc.unique_index_id = ic.index_id "
+    "JOIN sys.columns col "
+    "ON ic.object_id = col.object_id "
+    "AND ic.column_id = col.column_id "
+    "WHERE s.name = ? AND t.name = ? "
+    "ORDER BY kc.name, ic.key_ordinal"
+)
+
+_Q_FOREIGN_KEYS = sys.intern(
+    "SELECT fk.name AS foreign_key_name, "
+    "ps.name AS parent_schema, pt.name AS parent_table, "
+    "pc.name AS parent_column, "
+    "rs.name AS referenced_schema, rt.name AS referenced_table, "
+    "rc.name AS referenced_column, "
+    "fk.delete_referential_action_desc, "
+    "fk.update_referential_action_desc, "
+    "fk.is_disabled, fk.is_not_trusted, "
+    "fkc.constraint_column_id "
+    "FROM sys.foreign_keys fk "
+    "JOIN sys.foreign_key_columns fkc "
+    "ON fk.object_id = fkc.constraint_object_id "
+    "JOIN sys.tables pt ON fkc.parent_object_id = pt.object_id "
+    "JOIN sys.schemas ps ON pt.schema_id = ps.schema_id "
+    "JOIN sys.columns pc "
+    "ON pc.object_id = pt.object_id AND pc.column_id = fkc.parent_column_id "
+    "JOIN sys.tables rt ON fkc.referenced_object_id = rt.object_id "
+    "JOIN sys.schemas rs ON rt.schema_id = rs.schema_id "
+    "JOIN sys.columns rc "
+    "ON rc.object_id = rt.object_id AND rc.column_id = fkc.referenced_column_id "
+    "WHERE ps.name = ? AND pt.name = ? "
+    "ORDER BY fk.name, fkc.constraint_column_id"
+)
+
+_Q_INDEX_DETAILS = sys.intern(
+    "SELECT i.name AS index_name, i.type_desc, i.is_unique, "
+    "i.is_primary_key, i.is_unique_constraint, i.is_disabled, "
+    "i.fill_factor, i.filter_definition, "
+    "c.name AS column_name, ic.key_ordinal, ic.is_included_column, "
+    "ic.is_descending_key "
+    "FROM sys.indexes i "
+    "JOIN sys.tables t ON i.object_id = t.object_id "
+    "JOIN sys.schemas s ON t.schema_id = s.schema_id "
+    "JOIN sys.index_columns ic "
+    "ON i.object_id = ic.object_id AND i.index_id = ic.index_id "
+    "JOIN sys.columns c "
+    "ON ic.object_id = c.object_id AND ic.column_id = c.column_id "
+    "WHERE s.name = ? AND t.name = ? AND i.name IS NOT NULL "
+    "ORDER BY i.name, ic.key_ordinal, ic.index_column_id"
+)
+
+_Q_VIEW_DEFINITION = sys.intern(
+    "SELECT m.definition "
+    "FROM sys.views v "
+    "JOIN sys.schemas s ON v.schema_id = s.schema_id "
+    "JOIN sys.sql_modules m ON v.object_id = m.object_id "
+    "WHERE s.name = ? AND v.name = ?"
+)
+
+_Q_STORED_PROCEDURE_DEFINITION = sys.intern(
+    "SELECT m.definition "
+    "FROM sys.procedures p "
+    "JOIN sys.schemas s ON p.schema_id = s.schema_id "
+    "JOIN sys.sql_modules m ON p.object_id = m.object_id "
+    "WHERE s.name = ? AND p.name = ?"
+)
+
+_Q_STORED_PROCEDURE_PARAMETERS = sys.intern(
+    "SELECT prm.name AS parameter_name, "
+    "t.name AS data_type, prm.max_length, prm.precision, prm.scale, "
+    "prm.is_output, prm.has_default_value "
+    "FROM sys.procedures p "
+    "JOIN sys.schemas s ON p.schema_id = s.schema_id "
+    "JOIN sys.parameters prm ON p.object_id = prm.object_id "
+    "JOIN sys.types t ON prm.user_type_id = t.user_type_id "
+    "WHERE s.name = ? AND p.name = ? "
+    "ORDER BY prm.parameter_id"
+)
+
+_Q_OBJECT_DEPENDENCIES = sys.intern(
+    "SELECT d.referenced_server_name, d.referenced_database_name, "
+    "d.referenced_schema_name, d.referenced_entity_name, "
+    "d.referenced_id, d.is_ambiguous "
+    "FROM sys.sql_expression_dependencies d "
+    "JOIN sys.objects o ON d.referencing_id = o.object_id "
+    "JOIN sys.schemas s ON o.schema_id = s.schema_id "
+    "WHERE s.name = ? AND o.name = ? "
+    "ORDER BY d.referenced_schema_name, d.referenced_entity_name"
+)
 
 
 def list_table_columns_impl(
     database: str, schema: str, table: str
 ) -> List[Dict[str, Any]]:
     """Return column metadata for the specified table."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT c.column_id, c.name AS column_name, t.name AS data_type, "
-            "c.max_length, c.precision, c.scale, c.is_nullable, "
-            "c.is_identity, c.is_computed, c.is_rowguidcol, "
-            "c.collation_name, dc.definition AS default_definition "
-            "FROM sys.columns c "
-            "JOIN sys.tables tbl ON c.object_id = tbl.object_id "
-            "JOIN sys.schemas s ON tbl.schema_id = s.schema_id "
-            "JOIN sys.types t ON c.user_type_id = t.user_type_id "
-            "LEFT JOIN sys.default_constraints dc "
-            "ON c.default_object_id = dc.object_id "
-            "WHERE s.name = ? AND tbl.name = ? "
-            "ORDER BY c.column_id"
-        ),
-        (schema, table),
-    )
+    return _fetch_rows(database, _Q_TABLE_COLUMNS, (schema, table))
 
 
 def list_view_columns_impl(
     database: str, schema: str, view: str
 ) -> List[Dict[str, Any]]:
     """Return column metadata for the specified view."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT c.column_id, c.name AS column_name, t.name AS data_type, "
-            "c.max_length, c.precision, c.scale, c.is_nullable, "
-            "c.collation_name "
-            "FROM sys.columns c "
-            "JOIN sys.views v ON c.object_id = v.object_id "
-            "JOIN sys.schemas s ON v.schema_id = s.schema_id "
-            "JOIN sys.types t ON c.user_type_id = t.user_type_id "
-            "WHERE s.name = ? AND v.name = ? "
-            "ORDER BY c.column_id"
-        ),
-        (schema, view),
-    )
+    return _fetch_rows(database, _Q_VIEW_COLUMNS, (schema, view))
 
 
 def list_table_constraints_impl(
     database: str, schema: str, table: str
 ) -> List[Dict[str, Any]]:
     """Return primary key and unique constraints for the specified table."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT kc.name AS constraint_name, kc.type_desc, "
-            "col.name AS column_name, ic.key_ordinal "
-            "FROM sys.key_constraints kc "
-            "JOIN sys.tables t ON kc.parent_object_id = t.object_id "
-            "JOIN sys.schemas s ON t.schema_id = s.schema_id "
-            "JOIN sys.index_columns ic "
-            "ON kc.parent_object_id = ic.object_id "
-            "AND kc.unique_index_id = ic.index_id "
-            "JOIN sys.columns col "
-            "ON ic.object_id = col.object_id "
-            "AND ic.column_id = col.column_id "
-            "WHERE s.name = ? AND t.name = ? "
-            "ORDER BY kc.name, ic.key_ordinal"
-        ),
-        (schema, table),
-    )
+    return _fetch_rows(database, _Q_TABLE_CONSTRAINTS, (schema, table))
 
 
 def list_foreign_keys_impl(
     database: str, schema: str, table: str
 ) -> List[Dict[str, Any]]:
     """Return foreign keys for the specified table."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT fk.name AS foreign_key_name, "
-            "ps.name AS parent_schema, pt.name AS parent_table, "
-            "pc.name AS parent_column, "
-            "rs.name AS referenced_schema, rt.name AS referenced_table, "
-            "rc.name AS referenced_column, "
-            "fk.delete_referential_action_desc, "
-            "fk.update_referential_action_desc, "
-            "fk.is_disabled, fk.is_not_trusted, "
-            "fkc.constraint_column_id "
-            "FROM sys.foreign_keys fk "
-            "JOIN sys.foreign_key_columns fkc "
-            "ON fk.object_id = fkc.constraint_object_id "
-            "JOIN sys.tables pt ON fkc.parent_object_id = pt.object_id "
-            "JOIN sys.schemas ps ON pt.schema_id = ps.schema_id "
-            "JOIN sys.columns pc "
-            "ON pc.object_id = pt.object_id AND pc.column_id = fkc.parent_column_id "
-            "JOIN sys.tables rt ON fkc.referenced_object_id = rt.object_id "
-            "JOIN sys.schemas rs ON rt.schema_id = rs.schema_id "
-            "JOIN sys.columns rc "
-            "ON rc.object_id = rt.object_id AND rc.column_id = fkc.referenced_column_id "
-            "WHERE ps.name = ? AND pt.name = ? "
-            "ORDER BY fk.name, fkc.constraint_column_id"
-        ),
-        (schema, table),
-    )
+    return _fetch_rows(database, _Q_FOREIGN_KEYS, (schema, table))
 
 
 def list_index_details_impl(
     database: str, schema: str, table: str
 ) -> List[Dict[str, Any]]:
     """Return index definitions (including columns) for the specified table."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT i.name AS index_name, i.type_desc, i.is_unique, "
-            "i.is_primary_key, i.is_unique_constraint, i.is_disabled, "
-            "i.fill_factor, i.filter_definition, "
-            "c.name AS column_name, ic.key_ordinal, ic.is_included_column, "
-            "ic.is_descending_key "
-            "FROM sys.indexes i "
-            "JOIN sys.tables t ON i.object_id = t.object_id "
-            "JOIN sys.schemas s ON t.schema_id = s.schema_id "
-            "JOIN sys.index_columns ic "
-            "ON i.object_id = ic.object_id AND i.index_id = ic.index_id "
-            "JOIN sys.columns c "
-            "ON ic.object_id = c.object_id AND ic.column_id = c.column_id "
-            "WHERE s.name = ? AND t.name = ? AND i.name IS NOT NULL "
-            "ORDER BY i.name, ic.key_ordinal, ic.index_column_id"
-        ),
-        (schema, table),
-    )
+    return _fetch_rows(database, _Q_INDEX_DETAILS, (schema, table))
+
+
+# Worker threads for describe_table_impl; one per per-table detail query.
+_TABLE_DETAIL_WORKERS = 4
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=_TABLE_DETAIL_WORKERS,
+                    thread_name_prefix="fde-sql-table-detail",
+                )
+    return _EXECUTOR
+
+
+def describe_table_impl(
+    database: str, schema: str, table: str
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Return columns, constraints, foreign keys, and indexes for a table.
+
+    The four queries run concurrently, each on its own pooled connection, so
+    the call waits roughly one round trip instead of four.
+    """
+    executor = _executor()
+    futures = {
+        section: executor.submit(_fetch_rows, database, query, (schema, table))
+        for section, query in (
+            ("columns", _Q_TABLE_COLUMNS),
+            ("constraints", _Q_TABLE_CONSTRAINTS),
+            ("foreign_keys", _Q_FOREIGN_KEYS),
+            ("indexes", _Q_INDEX_DETAILS),
+        )
+    }
+    return {section: future.result() for section, future in futures.items()}
 
 
 def list_view_definition_impl(
     database: str, schema: str, view: str
 ) -> List[Dict[str, Any]]:
     """Return the SQL definition of the specified view."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT m.definition "
-            "FROM sys.views v "
-            "JOIN sys.schemas s ON v.schema_id = s.schema_id "
-            "JOIN sys.sql_modules m ON v.object_id = m.object_id "
-            "WHERE s.name = ? AND v.name = ?"
-        ),
-        (schema, view),
-    )
+    return _fetch_rows(database, _Q_VIEW_DEFINITION, (schema, view))
 
 
 def list_stored_procedure_definition_impl(
     database: str, schema: str, procedure: str
 ) -> List[Dict[str, Any]]:
     """Return the SQL definition of the specified stored procedure."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT m.definition "
-            "FROM sys.procedures p "
-            "JOIN sys.schemas s ON p.schema_id = s.schema_id "
-            "JOIN sys.sql_modules m ON p.object_id = m.object_id "
-            "WHERE s.name = ? AND p.name = ?"
-        ),
-        (schema, procedure),
-    )
+    return _fetch_rows(database, _Q_STORED_PROCEDURE_DEFINITION, (schema, procedure))
 
 
 def list_stored_procedure_parameters_impl(
     database: str, schema: str, procedure: str
 ) -> List[Dict[str, Any]]:
     """Return parameters for the specified stored procedure."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT prm.name AS parameter_name, "
-            "t.name AS data_type, prm.max_length, prm.precision, prm.scale, "
-            "prm.is_output, prm.has_default_value "
-            "FROM sys.procedures p "
-            "JOIN sys.schemas s ON p.schema_id = s.schema_id "
-            "JOIN sys.parameters prm ON p.object_id = prm.object_id "
-            "JOIN sys.types t ON prm.user_type_id = t.user_type_id "
-            "WHERE s.name = ? AND p.name = ? "
-            "ORDER BY prm.parameter_id"
-        ),
-        (schema, procedure),
-    )
+    return _fetch_rows(database, _Q_STORED_PROCEDURE_PARAMETERS, (schema, procedure))
 
 
 def list_object_dependencies_impl(
     database: str, schema: str, object_name: str
 ) -> List[Dict[str, Any]]:
     """Return referenced objects for the specified object."""
-    return _fetch_rows(
-        database,
-        (
-            "SELECT d.referenced_server_name, d.referenced_database_name, "
-            "d.referenced_schema_name, d.referenced_entity_name, "
-            "d.referenced_id, d.is_ambiguous "
-            "FROM sys.sql_expression_dependencies d "
-            "JOIN sys.objects o ON d.referencing_id = o.object_id "
-            "JOIN sys.schemas s ON o.schema_id = s.schema_id "
-            "WHERE s.name = ? AND o.name = ? "
-            "ORDER BY d.referenced_schema_name, d.referenced_entity_name"
-        ),
-        (schema, object_name),
-    )
+    return _fetch_rows(database, _Q_OBJECT_DEPENDENCIES, (schema, object_name))
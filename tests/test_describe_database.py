@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+# Settings are read at import time and require a server host.
+os.environ.setdefault("SQL_SERVER_HOST", "localhost")
+
+from fde_sql_mcp.tools import databases as db  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.timeout = 0
+        self.arraysize = 1
+        self.description = [("name",)]
+        self._sets = []
+        self._rows = []
+
+    def execute(self, sql):
+        self.connection.executed.append(sql)
+        self._sets = [[(f"row{i}",)] for i in range(sql.count("SELECT"))]
+        self.nextset()
+        return self
+
+    def fetchmany(self):
+        batch, self._rows = self._rows, []
+        return batch
+
+    def nextset(self):
+        if not self._sets:
+            return False
+        self._rows = self._sets.pop(0)
+        return True
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.executed = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    connection = FakeConnection()
+    monkeypatch.setattr(db, "get_sql_connection", lambda **kwargs: connection)
+    monkeypatch.setattr(db, "_METADATA_CACHE", db._TTLCache(maxsize=8, ttl=60))
+    return connection
+
+
+def test_describe_database_returns_every_section(connection):
+    snapshot = db.describe_database_impl("db")
+
+    assert list(snapshot) == [
+        section for section, _ in db._DESCRIBE_DATABASE_SECTIONS
+    ]
+    assert all(rows for rows in snapshot.values())
+
+
+def test_describe_database_is_cached_and_copied(connection):
+    first = db.describe_database_impl("db")
+    first["tables"].clear()
+    second = db.describe_database_impl("db")
+
+    assert len(connection.executed) == 1
+    assert second["tables"]
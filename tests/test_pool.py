@@ -0,0 +1,186 @@
+import pytest
+
+from fde_sql_mcp.clients.pool import ConnectionPool
+
+KEY = ("server", "db")
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def fetchone(self):
+        if not self.connection.alive:
+            raise RuntimeError("connection is dead")
+        return (1,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, *, alive=True, rollback_fails=False):
+        self.alive = alive
+        self.rollback_fails = rollback_fails
+        self.closed = False
+        self.rollbacks = 0
+        self.executed = []
+
+    def execute(self, sql):
+        self.executed.append(sql)
+        return FakeCursor(self)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        if self.rollback_fails:
+            raise RuntimeError("rollback failed")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    pool = ConnectionPool(300, validate_after_seconds=30, max_idle_per_key=2)
+    yield pool
+    pool.clear()
+
+
+def _checkout(pool, connection, key=KEY):
+    return pool.acquire(key, lambda: connection)
+
+
+def _age(pool, key, seconds):
+    for pooled in pool._idle[key]:
+        pooled.returned_at -= seconds
+
+
+def test_acquire_opens_a_connection_when_none_is_idle(pool):
+    connection = FakeConnection()
+
+    assert _checkout(pool, connection).connection is connection
+
+
+def test_release_rolls_back_before_pooling(pool):
+    connection = FakeConnection()
+    pool.release(KEY, _checkout(pool, connection))
+
+    assert connection.rollbacks == 1
+    assert not connection.closed
+
+
+def test_acquire_reuses_most_recently_returned_connection(pool):
+    older, newer = FakeConnection(), FakeConnection()
+    first, second = _checkout(pool, older), _checkout(pool, newer)
+    pool.release(KEY, first)
+    pool.release(KEY, second)
+
+    reused = pool.acquire(KEY, pytest.fail)
+
+    assert reused is second
+
+
+def test_acquire_skips_validation_for_recently_returned_connections(pool):
+    connection = FakeConnection()
+    pool.release(KEY, _checkout(pool, connection))
+
+    pool.acquire(KEY, pytest.fail)
+
+    assert connection.executed == []
+
+
+def test_acquire_validates_connections_idle_past_threshold(pool):
+    connection = FakeConnection()
+    pooled = _checkout(pool, connection)
+    pool.release(KEY, pooled)
+    _age(pool, KEY, 60)
+
+    assert pool.acquire(KEY, pytest.fail) is pooled
+    assert connection.executed == ["SELECT 1"]
+
+
+def test_acquire_replaces_connection_that_fails_validation(pool):
+    dead, fresh = FakeConnection(), FakeConnection()
+    pool.release(KEY, _checkout(pool, dead))
+    dead.alive = False
+    _age(pool, KEY, 60)
+
+    assert _checkout(pool, fresh).connection is fresh
+    assert dead.closed
+
+
+def test_acquire_closes_expired_connections(pool):
+    stale, fresh = FakeConnection(), FakeConnection()
+    pool.release(KEY, _checkout(pool, stale))
+    _age(pool, KEY, 301)
+
+    assert _checkout(pool, fresh).connection is fresh
+    assert stale.closed
+    assert stale.executed == []
+
+
+def test_sweep_expires_keys_that_are_never_requested_again(pool):
+    other_key = ("server", "other")
+    stale, live = FakeConnection(), FakeConnection()
+    pool.release(other_key, _checkout(pool, stale, other_key))
+    pool.release(KEY, _checkout(pool, live))
+    _age(pool, other_key, 301)
+
+    pool.sweep()
+
+    assert stale.closed
+    assert other_key not in pool._idle
+    assert not live.closed
+    assert len(pool._idle[KEY]) == 1
+
+
+def test_release_with_discard_closes_connection(pool):
+    connection = FakeConnection()
+    pool.release(KEY, _checkout(pool, connection), discard=True)
+
+    assert connection.closed
+    assert connection.rollbacks == 0
+    assert not pool._idle.get(KEY)
+
+
+def test_release_closes_connection_when_rollback_fails(pool):
+    connection = FakeConnection(rollback_fails=True)
+    pool.release(KEY, _checkout(pool, connection))
+
+    assert connection.closed
+    assert not pool._idle.get(KEY)
+
+
+def test_release_closes_connections_beyond_max_idle_per_key(pool):
+    connections = [FakeConnection() for _ in range(3)]
+    checked_out = [_checkout(pool, c) for c in connections]
+    for pooled in checked_out:
+        pool.release(KEY, pooled)
+
+    assert [c.closed for c in connections] == [False, False, True]
+    assert len(pool._idle[KEY]) == 2
+
+
+def test_zero_idle_timeout_disables_pooling():
+    pool = ConnectionPool(0)
+    connection = FakeConnection()
+
+    assert not pool.enabled
+    pool.release(KEY, pool.acquire(KEY, lambda: connection))
+
+    assert connection.closed
+    assert pool._idle == {}
+    assert pool._reaper is None
+
+
+def test_clear_closes_idle_connections(pool):
+    connection = FakeConnection()
+    pool.release(KEY, _checkout(pool, connection))
+
+    pool.clear()
+
+    assert connection.closed
+    assert pool._idle == {}
@@ -0,0 +1,83 @@
+import os
+import re
+
+import pytest
+
+# Settings are read at import time and require a server host.
+os.environ.setdefault("SQL_SERVER_HOST", "localhost")
+
+from fde_sql_mcp.tools import databases as db  # noqa: E402
+
+_STRIP_PATTERN = db._STRIP_RE.pattern
+
+
+@pytest.fixture(params=["re", "re2"])
+def validate(request, monkeypatch):
+    engine = re if request.param == "re" else pytest.importorskip("re2")
+    monkeypatch.setattr(db, "_STRIP_RE", engine.compile(_STRIP_PATTERN))
+    monkeypatch.setattr(db, "_ENFORCE_READONLY", True)
+    monkeypatch.setattr(db, "_MAX_QUERY_CHARS", 10000)
+    db._readonly_query_error.cache_clear()
+    yield db._validate_readonly_query
+    db._readonly_query_error.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT 1",
+        "SELECT 1;",
+        "  with x as (select 1 a) select * from x",
+        "\xa0select 1",
+        "　select 1",
+        "SELECT * FROM t WHERE a = 'drop table'",
+        "SELECT 'a;b'",
+        "SELECT N'it''s; drop' AS x",
+        "SELECT [update] FROM t",
+        "SELECT [a]]b] FROM t",
+        "SELECT [sp_who] FROM t",
+        "SELECT * FROM t WHERE a LIKE 'sp_%'",
+        "SELECT 1 -- drop\n",
+        "SELECT 1 -- ; delete",
+        "/* delete */ SELECT 1",
+        "SELECT 1 /* ; */",
+    ],
+)
+def test_allows_readonly_queries(validate, query):
+    validate(query)
+
+
+@pytest.mark.parametrize(
+    ("query", "message"),
+    [
+        ("", "Query cannot be empty."),
+        ("   ", "Query cannot be empty."),
+        ("SELECT " + "a," * 6000 + "b", "maximum allowed length"),
+        ("UPDATE t SET a = 1", "Only SELECT"),
+        ("SELECT 1; SELECT 2", "Multiple statements"),
+        # Used to pass: "--" inside the string was stripped as a comment,
+        # hiding the rest of the batch.
+        ("SELECT '--' ; DELETE FROM t", "Multiple statements"),
+        # Block comments do not nest; the first */ closes the comment.
+        ("/* a /* b */ DELETE */ SELECT 1", "Only SELECT"),
+        ("SELECT 1 /* DELETE", "Disallowed keyword detected"),
+        ("SELECT 'abc; DELETE", "Multiple statements"),
+        # "]]" is not treated as an escaped bracket, so the name is split.
+        ("SELECT [a]]delete] FROM t", "Disallowed keyword detected"),
+        (
+            "SELECT * INTO x FROM t",
+            "Disallowed keyword detected in read-only mode: INTO",
+        ),
+        ("SELECT sp_who", "Executing procedures"),
+        ("SELECT 1 FROM xp_cmdshell", "Executing procedures"),
+        ("SELECT SP_Who", "Executing procedures"),
+    ],
+)
+def test_rejects_non_readonly_queries(validate, query, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        validate(query)
+
+
+def test_enforcement_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(db, "_ENFORCE_READONLY", False)
+    db._validate_readonly_query("DELETE FROM t")
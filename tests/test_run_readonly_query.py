@@ -0,0 +1,109 @@
+import os
+
+import pytest
+
+# Settings are read at import time and require a server host.
+os.environ.setdefault("SQL_SERVER_HOST", "localhost")
+
+from fde_sql_mcp.clients.pool import PooledConnection  # noqa: E402
+from fde_sql_mcp.tools import databases as db  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self, executed):
+        self.executed = executed
+        self.timeout = 0
+        self.arraysize = 1
+        self.description = None
+        self._rows = []
+
+    def execute(self, sql, *params):
+        self.executed.append(sql)
+        self.description = [("id",), ("name",)]
+        self._rows = [(i, f"r{i}") for i in range(3)]
+        return self
+
+    def fetchmany(self):
+        batch = self._rows[: self.arraysize]
+        del self._rows[: self.arraysize]
+        return batch
+
+    def nextset(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self.executed)
+
+    def execute(self, sql):
+        return self.cursor().execute(sql)
+
+
+class FakeSQLServerConnection:
+    """Hands out the same pooled connection every time, like a warm pool."""
+
+    def __init__(self, pooled):
+        self._pooled = pooled
+        self.reusable = True
+
+    def __enter__(self):
+        return self._pooled.connection
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def statement_cursor(self, sql):
+        return self._pooled.statement_cursor(sql)
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    pooled = PooledConnection(connection=FakeConnection())
+    monkeypatch.setattr(
+        db,
+        "get_sql_connection",
+        lambda **kwargs: FakeSQLServerConnection(pooled),
+    )
+    monkeypatch.setattr(db, "_ENFORCE_READONLY", True)
+    return pooled.connection
+
+
+def _statements(connection):
+    return [
+        sql for sql in connection.executed if sql.startswith("SET ROWCOUNT ?")
+    ]
+
+
+def test_returns_columnar_rows(connection):
+    result = db.run_readonly_query_impl("db", "SELECT id, name FROM t", 2)
+
+    assert result == {
+        "columns": ["id", "name"],
+        "rows": [[0, "r0"], [1, "r1"]],
+        "row_count": 2,
+        "row_limit": 2,
+        "truncated": True,
+    }
+
+
+def test_repeated_query_executes_the_same_string_object(connection):
+    # pyodbc only skips SQLPrepare when it is given the identical object.
+    db.run_readonly_query_impl("db", "SELECT id, name FROM t", 5)
+    db.run_readonly_query_impl("db", "SELECT id, name FROM t", 5)
+
+    first, second = _statements(connection)
+    assert first == second
+    assert first is second
+
+
+def test_row_cap_is_reset_after_each_query(connection):
+    db.run_readonly_query_impl("db", "SELECT 1", 5)
+
+    assert connection.executed[-1] == "SET ROWCOUNT 0"
@@ -0,0 +1,62 @@
+import dataclasses
+import os
+from types import SimpleNamespace
+
+import pytest
+
+# Settings are read at import time and require a server host.
+os.environ.setdefault("SQL_SERVER_HOST", "localhost")
+
+from fde_sql_mcp.clients import sql  # noqa: E402
+
+
+class FakeConnection:
+    def __init__(self, fail_setup=False):
+        self.fail_setup = fail_setup
+        self.closed = False
+
+    def execute(self, sql_text):
+        if self.fail_setup:
+            raise RuntimeError("SET NOCOUNT failed")
+        return SimpleNamespace(close=lambda: None)
+
+    def close(self):
+        self.closed = True
+
+
+def _patch_connect(monkeypatch, connection):
+    fake_pyodbc = SimpleNamespace(connect=lambda conn_str: connection)
+    monkeypatch.setattr(sql, "_pyodbc", lambda: fake_pyodbc)
+
+
+def test_conn_open_returns_configured_connection(monkeypatch):
+    connection = FakeConnection()
+    _patch_connect(monkeypatch, connection)
+    conn = sql.SQLServerConnection("server", "db", driver="{Test Driver}")
+
+    assert conn._conn_open() is connection
+    assert not connection.closed
+
+
+def test_conn_open_closes_connection_when_session_setup_fails(monkeypatch):
+    connection = FakeConnection(fail_setup=True)
+    _patch_connect(monkeypatch, connection)
+    conn = sql.SQLServerConnection("server", "db", driver="{Test Driver}")
+
+    with pytest.raises(RuntimeError, match="SET NOCOUNT failed"):
+        conn._conn_open()
+    assert connection.closed
+
+
+@pytest.mark.parametrize(
+    ("port", "expected"),
+    [(None, "Server=host;"), ("1433", "Server=host,1433;")],
+)
+def test_build_conn_str_appends_configured_port(monkeypatch, port, expected):
+    patched = dataclasses.replace(sql.settings, sql_server_port=port)
+    monkeypatch.setattr(sql, "settings", patched)
+    sql._build_conn_str.cache_clear()
+    try:
+        assert expected in sql._build_conn_str("host", "db", "{Test Driver}")
+    finally:
+        sql._build_conn_str.cache_clear()
@@ -0,0 +1,61 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+# Settings are read at import time and require a server host.
+os.environ.setdefault("SQL_SERVER_HOST", "localhost")
+
+from fde_sql_mcp.clients.worker import DBWorker  # noqa: E402
+
+
+def _run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_submit_returns_result():
+    worker = DBWorker(name="test-worker")
+
+    assert _run(worker.submit(lambda a, b: a + b, 2, 3)) == 5
+
+
+def test_submit_raises_exception_from_call():
+    worker = DBWorker(name="test-worker")
+
+    def fail():
+        raise ValueError("bad query")
+
+    with pytest.raises(ValueError, match="bad query"):
+        _run(worker.submit(fail))
+
+
+def test_base_exception_is_wrapped_and_worker_survives():
+    worker = DBWorker(name="test-worker")
+    original = SystemExit(3)
+
+    def abort():
+        raise original
+
+    async def scenario():
+        with pytest.raises(RuntimeError, match="aborted") as info:
+            await worker.submit(abort)
+        assert info.value.__cause__ is original
+        return await worker.submit(lambda: "still running")
+
+    assert _run(scenario()) == "still running"
+
+
+def test_workers_run_calls_concurrently():
+    worker = DBWorker(name="test-worker", workers=2)
+    release = threading.Event()
+
+    async def scenario():
+        blocked = asyncio.ensure_future(worker.submit(release.wait, 5))
+        # Completes while the first call still holds the other thread.
+        result = await worker.submit(lambda: "not blocked")
+        release.set()
+        await blocked
+        return result
+
+    assert _run(scenario()) == "not blocked"
@@ -14,8 +14,9 @@ from fde_sql_mcp.config import settings
 print('Configured server:', settings.sql_server)
 print('Configured database:', settings.sql_database)
 
-conn = get_sql_connection(server=settings.sql_server, database=settings.sql_database)
-with conn.get_connection() as conn_obj:
+with get_sql_connection(
+    server=settings.sql_server, database=settings.sql_database
+) as conn_obj:
     cursor = conn_obj.cursor()
     cursor.execute('SELECT 1')
     print('Query result:', cursor.fetchone())